@@ -4,9 +4,18 @@ from queue import Empty
 
 def get_last_parameters(parameter_queue, timeout=0.001):
     params = None
-    while True:
+    try:
+        while True:
+            params = parameter_queue.get_nowait()
+    except Empty:
+        pass
+    # only wait for new parameters if nothing was queued already.
+    # Items put on a multiprocessing.Queue only become visible once its feeder
+    # thread has flushed them, so values put just before this call may be
+    # picked up only by the next one
+    if params is None:
         try:
             params = parameter_queue.get(timeout=timeout)
         except Empty:
-            break
+            pass
     return params
@@ -13,9 +13,8 @@ class YagmailNotifier(AbstractNotifier):
         if ("@" not in self.sender_email) or ("@" not in self.receiver_email):
             return False
         subject = f"Your {self.setup_name} experiment is complete"
-        sender_password = self.password
 
-        yag = yagmail.SMTP(user=self.sender_email, password=sender_password)
+        yag = yagmail.SMTP(user=self.sender_email, password=self.password)
 
         body = [
             "Hey!",
@@ -36,3 +35,5 @@ class YagmailNotifier(AbstractNotifier):
             yagmail.error.YagInvalidEmailAddress,
         ):
             return False
+        finally:
+            yag.close()
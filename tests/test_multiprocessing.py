@@ -0,0 +1,41 @@
+from queue import Queue
+from threading import Timer
+import multiprocessing as mp
+import time
+from scopecuisine.multiprocessing import get_last_parameters
+
+
+def test_get_last_parameters():
+    q = Queue()
+    assert get_last_parameters(q) is None
+
+    for i in range(5):
+        q.put(i)
+    assert get_last_parameters(q) == 4
+    assert q.empty()
+
+
+def test_get_last_parameters_mp_queue():
+    q = mp.Queue()
+    for i in range(5):
+        q.put(i)
+    # let the feeder thread flush the items to the pipe
+    time.sleep(0.1)
+    assert get_last_parameters(q) == 4
+
+
+def test_get_last_parameters_does_not_wait_if_queued():
+    q = Queue()
+    for i in range(5):
+        q.put(i)
+    t_start = time.monotonic()
+    assert get_last_parameters(q, timeout=1) == 4
+    assert time.monotonic() - t_start < 0.5
+
+
+def test_get_last_parameters_waits_on_empty():
+    q = Queue()
+    timer = Timer(0.05, q.put, args=("new",))
+    timer.start()
+    assert get_last_parameters(q, timeout=1) == "new"
+    timer.join()
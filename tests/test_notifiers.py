@@ -1,4 +1,5 @@
 #!/usr/bin/env python
+from unittest import mock
 from scopecuisine.notifiers.yagmail import YagmailNotifier
 
 
@@ -8,3 +9,19 @@ def test_yagmail():
 
     notifier = YagmailNotifier("test", sender="a@b.com", password="", receiver="")
     assert not notifier.notify()
+
+
+def test_yagmail_closes_connection():
+    with mock.patch("scopecuisine.notifiers.yagmail.yagmail.SMTP") as smtp:
+        clients = [mock.Mock(), mock.Mock()]
+        smtp.side_effect = clients
+        notifier = YagmailNotifier(
+            "test", sender="a@b.com", password="", receiver="c@d.com"
+        )
+        assert notifier.notify()
+        assert notifier.notify()
+
+    assert smtp.call_count == 2
+    for client in clients:
+        client.send.assert_called_once()
+        client.close.assert_called_once()